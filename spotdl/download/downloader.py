@@ -168,7 +168,9 @@ class Downloader:
             for scan_format in self.scan_formats:
                 logger.debug("Scanning for %s files", scan_format)
 
-                found_files = gather_known_songs(self.settings["output"], scan_format)
+                found_files = gather_known_songs(
+                    self.settings["output"], scan_format, self.settings["threads"]
+                )
 
                 logger.debug("Found %s %s files", len(found_files), scan_format)
 
@@ -487,10 +489,11 @@ class Downloader:
             dup_song_paths: List[Path] = self.known_songs.get(song.url, [])
 
             # Remove files from the list that have the same path as the output file
+            absolute_output_file = output_file.absolute()
             dup_song_paths = [
                 dup_song_path
                 for dup_song_path in dup_song_paths
-                if (dup_song_path.absolute() != output_file.absolute())
+                if (dup_song_path.absolute() != absolute_output_file)
                 and dup_song_path.exists()
             ]
 
@@ -514,7 +517,7 @@ class Downloader:
             # If the file already exists and we don't want to overwrite it,
             # we can skip the download
             if (  # pylint: disable=R1705
-                Path(str(output_file.absolute()) + ".skip").exists()
+                Path(str(absolute_output_file) + ".skip").exists()
                 and self.settings["respect_skip_file"]
             ):
                 logger.info(
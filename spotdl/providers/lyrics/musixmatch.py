@@ -2,23 +2,37 @@
 MusixMatch lyrics provider.
 """
 
+import re
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from spotdl.providers.lyrics.base import LyricsProvider
 from spotdl.utils.config import GlobalConfig
 
 __all__ = ["MusixMatch"]
 
+# Only the tags we read are parsed, the rest of the page is skipped
+SONG_URL_STRAINER = SoupStrainer("a", href=re.compile(r"^/lyrics/"))
+# class_ is matched against the raw attribute string, so split it into tokens
+LYRICS_STRAINER = SoupStrainer(
+    "p", class_=lambda c: c is not None and "mxm-lyrics__content" in c.split()
+)
+
 
 class MusixMatch(LyricsProvider):
     """
     MusixMatch lyrics provider class.
     """
 
+    def __init__(self):
+        super().__init__()
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def extract_lyrics(self, url: str, **_) -> Optional[str]:
         """
         Extracts the lyrics from the given url.
@@ -31,15 +45,16 @@ class MusixMatch(LyricsProvider):
         - The lyrics of the song or None if no lyrics were found.
         """
 
-        lyrics_resp = requests.get(
+        lyrics_resp = self.session.get(
             url,
-            headers=self.headers,
             timeout=10,
             proxies=GlobalConfig.get_parameter("proxies"),
         )
 
-        lyrics_soup = BeautifulSoup(lyrics_resp.text, "html.parser")
-        lyrics_paragraphs = lyrics_soup.select("p.mxm-lyrics__content")
+        lyrics_soup = BeautifulSoup(
+            lyrics_resp.text, "html.parser", parse_only=LYRICS_STRAINER
+        )
+        lyrics_paragraphs = lyrics_soup.find_all("p")
         lyrics = "\n".join(i.get_text() for i in lyrics_paragraphs)
 
         return lyrics
@@ -58,8 +73,9 @@ class MusixMatch(LyricsProvider):
         """
 
         track_search = kwargs.get("track_search", False)
+        name_lower = name.lower()
         artists_str = ", ".join(
-            artist for artist in artists if artist.lower() not in name.lower()
+            artist for artist in artists if artist.lower() not in name_lower
         )
 
         # quote the query so that it's safe to use in a url
@@ -71,14 +87,15 @@ class MusixMatch(LyricsProvider):
             query += "/tracks"
 
         search_url = f"https://www.musixmatch.com/search/{query}"
-        search_resp = requests.get(
+        search_resp = self.session.get(
             search_url,
-            headers=self.headers,
             timeout=10,
             proxies=GlobalConfig.get_parameter("proxies"),
         )
-        search_soup = BeautifulSoup(search_resp.text, "html.parser")
-        song_url_tag = search_soup.select("a[href^='/lyrics/']")
+        search_soup = BeautifulSoup(
+            search_resp.text, "html.parser", parse_only=SONG_URL_STRAINER
+        )
+        song_url_tag = search_soup.find_all("a")
 
         if not song_url_tag:
             # song_url_tag being None means no results were found on the
@@ -2,6 +2,7 @@
 Playlist module for retrieving playlist data from Spotify.
 """
 
+import concurrent.futures
 import logging
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
@@ -75,23 +76,36 @@ class Playlist(SongList):
 
         # Get all tracks from playlist
         tracks = playlist_response["items"]
-        while playlist_response["next"]:
-            playlist_response = spotify_client.next(playlist_response)
+        if playlist_response["next"]:
+            # The first page tells us how many tracks there are,
+            # so the remaining pages can be requested all at once
+            limit = playlist_response["limit"]
+            offsets = range(
+                playlist_response["offset"] + limit, playlist_response["total"], limit
+            )
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                responses = executor.map(
+                    lambda offset: spotify_client.playlist_items(url, offset=offset),
+                    offsets,
+                )
 
-            # Failed to get response, break the loop
-            if playlist_response is None:
-                break
+                for response in responses:
+                    # Failed to get response, break the loop
+                    if response is None:
+                        break
 
-            # Add tracks to the list
-            tracks.extend(playlist_response["items"])
+                    # Add tracks to the list
+                    tracks.extend(response["items"])
 
         songs = []
         for track_no, track in enumerate(tracks):
-            if not isinstance(track, dict) or track.get("track") is None:
+            if (
+                not isinstance(track, dict)
+                or (track_meta := track.get("track")) is None
+            ):
                 continue
 
-            track_meta = track["track"]
-
             if track_meta.get("is_local") or track_meta.get("type") != "track":
                 logger.warning(
                     "Skipping track: %s local tracks and %s are not supported",
@@ -6,7 +6,7 @@ import json
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from spotdl.utils.spotify import SpotifyClient
 
@@ -335,12 +335,15 @@ class SongList:
                 f"No {list_type} matches found on spotify for '{search_term}'"
             )
 
-        matches = {}
-        for result in raw_search_results[f"{list_type}s"]["items"]:
-            score = fuzz.ratio(search_term.split(":", 1)[1].strip(), result["name"])
-            matches[result["id"]] = score
+        matches = {
+            result["id"]: result["name"]
+            for result in raw_search_results[f"{list_type}s"]["items"]
+        }
 
-        best_match = max(matches, key=matches.get)  # type: ignore
+        # Score all results in one call, returns (name, score, id) of the best match
+        _, _, best_match = process.extractOne(  # type: ignore
+            search_term.split(":", 1)[1].strip(), matches, scorer=fuzz.ratio
+        )
 
         return cls.from_url(
             f"http://open.spotify.com/{list_type}/{best_match}",
@@ -70,6 +70,12 @@ JAP_REGEX = re.compile(
 )
 
 DISALLOWED_REGEX = re.compile(r"[^-a-zA-Z0-9\!\@\$]+")
+
+# "/?\\*|<>" are windows specific disallowed characters and are removed,
+# double quotes (") and colons (:) are also disallowed characters but we would
+# like to retain their equivalents, so they are replaced instead
+SANITIZE_TABLE = str.maketrans('":', "'-", "/?\\*|<>")
+
 YT_DLP_PARSER = create_parser()
 
 logger = logging.getLogger(__name__)
@@ -109,16 +115,7 @@ def sanitize_string(string: str) -> str:
     - the sanitized string
     """
 
-    output = string
-
-    # this is windows specific (disallowed chars)
-    output = "".join(char for char in output if char not in "/?\\*|<>")
-
-    # double quotes (") and semi-colons (:) are also disallowed characters but we would
-    # like to retain their equivalents, so they aren't removed in the prior loop
-    output = output.replace('"', "'").replace(":", "-")
-
-    return output
+    return string.translate(SANITIZE_TABLE)
 
 
 @lru_cache()
@@ -211,10 +208,9 @@ def format_query(
 
     # Remove artists from the list that are already in the title
     if short:
+        slug_name = slugify(song.name)
         artists = [
-            artist
-            for artist in song.artists
-            if slugify(artist) not in slugify(song.name)
+            artist for artist in song.artists if slugify(artist) not in slug_name
         ]
 
         # Add the main artist again to the list
@@ -249,16 +245,15 @@ def format_query(
         "{list-length}": song.list_length,
     }
 
-    if santitize:
-        # sanitize the values in formats dict
-        for key, value in formats.items():
-            if value is None:
-                continue
+    # Replace all the keys with the values,
+    # only values of keys present in the template are sanitized
+    for key, value in formats.items():
+        if key not in template:
+            continue
 
-            formats[key] = sanitize_string(str(value))
+        if santitize and value is not None:
+            value = sanitize_string(str(value))
 
-    # Replace all the keys with the values
-    for key, value in formats.items():
         template = template.replace(key, str(value))
 
     return template
@@ -445,17 +440,19 @@ def parse_duration(duration: Optional[str]) -> float:
     - the float value of seconds
     """
 
-    if duration is None:
+    if not isinstance(duration, str):
         return 0.0
 
     try:
-        # {(1, "s"), (60, "m"), (3600, "h")}
-        mapped_increments = zip([1, 60, 3600], reversed(duration.split(":")))
-        seconds = sum(multiplier * int(time) for multiplier, time in mapped_increments)
+        # Only the last three parts are used, "hours:minutes:seconds"
+        seconds = 0
+        for time in duration.split(":")[-3:]:
+            seconds = seconds * 60 + int(time)
+
         return float(seconds)
 
     # This usually occurs when the wrong string is mistaken for the duration
-    except (ValueError, TypeError, AttributeError):
+    except ValueError:
         return 0.0
 
 
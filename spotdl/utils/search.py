@@ -8,9 +8,10 @@ To use this module you must first initialize the SpotifyClient.
 import concurrent.futures
 import json
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
 from ytmusicapi import YTMusic
@@ -30,6 +31,7 @@ __all__ = [
     "get_simple_songs",
     "reinit_song",
     "get_song_from_file_metadata",
+    "find_files",
     "gather_known_songs",
     "create_ytm_album",
     "create_ytm_playlist",
@@ -589,13 +591,52 @@ def get_song_from_file_metadata(file: Path, id3_separator: str = "/") -> Optiona
     return Song.from_missing_data(**file_metadata)
 
 
-def gather_known_songs(output: str, output_format: str) -> Dict[str, List[Path]]:
+def find_files(base_dir: Path, extension: str) -> Iterator[Path]:
+    """
+    Recursively find all files with the given extension
+
+    ### Arguments
+    - base_dir: Directory to search in
+    - extension: File extension without the leading dot
+
+    ### Returns
+    - Iterator over the paths of the matching files
+
+    ### Notes
+    - Uses `os.scandir` so that the entry type comes from the directory listing
+    instead of a separate `stat` call for every file.
+    - Directories that can't be read and symlinked directories are skipped,
+    same as `Path.glob`.
+    - The extension is matched using the platform's case rules.
+    """
+
+    suffix = os.path.normcase(f".{extension}")
+    directories = [str(base_dir)]
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif (
+                        os.path.normcase(entry.name).endswith(suffix)
+                        and entry.is_file()
+                    ):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def gather_known_songs(
+    output: str, output_format: str, threads: int = 1
+) -> Dict[str, List[Path]]:
     """
     Gather all known songs from the output directory
 
     ### Arguments
     - output: Output path template
     - output_format: Output format
+    - threads: Number of threads to use
 
     ### Returns
     - Dictionary containing all known songs and their paths
@@ -604,10 +645,9 @@ def gather_known_songs(output: str, output_format: str) -> Dict[str, List[Path]]
     # Get the base directory from the path template
     # Path("/Music/test/{artist}/{artists} - {title}.{output-ext}") -> "/Music/test"
     base_dir = output.split("{", 1)[0]
-    paths = Path(base_dir).glob(f"**/*.{output_format}")
+    paths = list(find_files(Path(base_dir), output_format))
 
-    known_songs: Dict[str, List[Path]] = {}
-    for path in paths:
+    def get_song(path: Path) -> Optional[Song]:
         # Try to get the song from the metadata
         song = get_song_from_file_metadata(path)
 
@@ -615,15 +655,23 @@ def gather_known_songs(output: str, output_format: str) -> Dict[str, List[Path]]
         if song is None or song.url is None:
             search_results = get_search_results(path.stem)
             if len(search_results) == 0:
-                continue
+                return None
 
             song = search_results[0]
 
-        known_paths = known_songs.get(song.url)
-        if known_paths is None:
-            known_songs[song.url] = [path]
-        else:
-            known_songs[song.url].append(path)
+        return song
+
+    known_songs: Dict[str, List[Path]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for path, song in zip(paths, executor.map(get_song, paths)):
+            if song is None:
+                continue
+
+            known_paths = known_songs.get(song.url)
+            if known_paths is None:
+                known_songs[song.url] = [path]
+            else:
+                known_songs[song.url].append(path)
 
     return known_songs
 
@@ -1,10 +1,31 @@
 # import pytest
 
-# from spotdl.providers.lyrics.musixmatch import MusixMatch
-
+from spotdl.providers.lyrics.musixmatch import MusixMatch
 
 # @pytest.mark.vcr()
 # def test_get_musixmatch_lyrics():
 #     musixmatch = MusixMatch()
 
 #     assert musixmatch.get_lyrics("Mortals", ["Warriyo"]) is not None
+
+
+def test_extract_lyrics_multiple_classes(mocker):
+    """
+    Lyrics paragraphs with extra classes or whitespace in the class
+    attribute should still be extracted.
+    """
+
+    musixmatch = MusixMatch()
+    response = mocker.Mock(
+        text=(
+            '<p class="mxm-lyrics__content">first</p>'
+            '<p class="mxm-lyrics__content ">second</p>'
+            '<p class="x mxm-lyrics__content">third</p>'
+            '<p class="other">ignored</p>'
+        )
+    )
+    mocker.patch.object(musixmatch.session, "get", return_value=response)
+
+    assert musixmatch.extract_lyrics("https://www.musixmatch.com/lyrics/a/b") == (
+        "first\nsecond\nthird"
+    )
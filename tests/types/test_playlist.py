@@ -1,6 +1,7 @@
 import pytest
 
 from spotdl.types.playlist import Playlist
+from spotdl.utils.spotify import SpotifyClient
 
 
 def test_playlist_init():
@@ -81,3 +82,66 @@ def test_playlist_length():
     )
 
     assert playlist.length == 9
+
+
+def test_playlist_get_metadata_pages(mocker):
+    """
+    Tests if Playlist.get_metadata() fetches all pages in order
+    and stops at the first page that failed to load.
+    """
+
+    url = "https://open.spotify.com/playlist/test"
+
+    def create_page(offset, total=500, limit=100):
+        return {
+            "offset": offset,
+            "limit": limit,
+            "total": total,
+            "next": f"{url}?offset={offset + limit}",
+            "items": [
+                {
+                    "track": {
+                        "id": f"track{offset + index}",
+                        "name": f"Track {offset + index}",
+                        "type": "track",
+                        "artists": [{"name": "Artist"}],
+                        "album": {},
+                        "disc_number": 1,
+                        "duration_ms": 1000,
+                        "track_number": index + 1,
+                        "explicit": False,
+                        "external_urls": {
+                            "spotify": f"https://open.spotify.com/track/{offset + index}"
+                        },
+                    }
+                }
+                for index in range(limit)
+            ],
+        }
+
+    def playlist_items(_, offset=0):
+        # The page at offset 300 failed to load
+        return None if offset == 300 else create_page(offset)
+
+    mocker.patch.object(
+        SpotifyClient,
+        "playlist",
+        return_value={
+            "name": "test",
+            "description": "",
+            "external_urls": {"spotify": url},
+            "owner": {"display_name": "test"},
+            "images": [],
+        },
+    )
+    playlist_items_mock = mocker.patch.object(
+        SpotifyClient, "playlist_items", side_effect=playlist_items
+    )
+
+    _, songs = Playlist.get_metadata(url)
+
+    assert [song.song_id for song in songs] == [f"track{index}" for index in range(300)]
+    assert [song.list_position for song in songs] == list(range(1, 301))
+    assert sorted(
+        call.kwargs.get("offset", 0) for call in playlist_items_mock.call_args_list
+    ) == [0, 100, 200, 300, 400]
@@ -2,7 +2,12 @@ import pytest
 
 from spotdl.types.saved import SavedError
 from spotdl.types.song import Song
-from spotdl.utils.search import get_search_results, get_simple_songs, parse_query
+from spotdl.utils.search import (
+    find_files,
+    get_search_results,
+    get_simple_songs,
+    parse_query,
+)
 
 SONG = ["https://open.spotify.com/track/2Ikdgh3J5vCRmnCL3Xcrtv"]
 PLAYLIST = ["https://open.spotify.com/playlist/78Lg6HmUqlTnmipvNxc536"]
@@ -89,3 +94,24 @@ def test_create_empty_song():
 def test_get_simple_songs():
     songs = get_simple_songs(QUERY)
     assert len(songs) > 1
+
+
+def test_find_files(tmp_path):
+    (tmp_path / "artist" / "album").mkdir(parents=True)
+    (tmp_path / "song.mp3").touch()
+    (tmp_path / "artist" / "album" / "song.mp3").touch()
+    (tmp_path / "artist" / "cover.jpg").touch()
+    (tmp_path / "artist" / "folder.mp3").mkdir()
+
+    # Symlinked directories are not followed, so this doesn't loop forever
+    try:
+        (tmp_path / "artist" / "loop").symlink_to(tmp_path, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported")
+
+    files = sorted(find_files(tmp_path, "mp3"))
+
+    assert files == [
+        tmp_path / "artist" / "album" / "song.mp3",
+        tmp_path / "song.mp3",
+    ]